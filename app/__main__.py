@@ -1,46 +1,28 @@
 """Main entry point for the application."""
 
-import asyncio
-
 import uvloop
-from fastapi import FastAPI
-from haolib.app import AppBuilder
 from haolib.configs.observability import ObservabilityConfig
 from haolib.configs.server import ServerConfig
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.app import create_app_builder
 from app.dependencies import create_container
-from app.routers.queues.router import mq_router
-from app.routers.router import router
-from app.version import __version__
 
 
 async def main() -> None:
     """Main entry point for the application."""
     container = create_container()
-    app = FastAPI(
-        title="Python Backend Template",
-        description="Python Backend Template.",
-        version=__version__,
-    )
-
-    app.include_router(router)
-
-    builder = AppBuilder(
+    builder = await create_app_builder(
         container,
-        app,
+        observability_config=await container.get(ObservabilityConfig),
     )
 
-    await builder.setup_dishka()
-    await builder.setup_faststream(mq_router.broker)
-    await builder.setup_idempotency_middleware()
-    await builder.setup_exception_handlers()
-    await builder.setup_cors_middleware()
-    await builder.setup_observability(observability_config=await container.get(ObservabilityConfig))
+    # Resolve the engine before serving, so its connection pool is filled at startup
+    await container.get(AsyncEngine)
 
     server = await builder.get_server(server_config=await container.get(ServerConfig))
     await server.serve()
 
 
 if __name__ == "__main__":
-    uvloop.install()
-    asyncio.run(main())
+    uvloop.run(main())
@@ -0,0 +1,70 @@
+"""Application factory."""
+
+from dishka import AsyncContainer
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from haolib.app import AppBuilder
+from haolib.configs.observability import ObservabilityConfig
+
+from app.middlewares.cors import StaticCORSMiddleware
+from app.middlewares.fast_path import FastPathMiddleware
+from app.middlewares.idempotency import IdempotencyMiddleware, IdempotencyStorage
+from app.routers.queues.router import get_broker
+from app.routers.responses import PydanticJSONResponse
+from app.routers.router import router
+from app.version import __version__
+
+
+async def create_app_builder(
+    container: AsyncContainer,
+    *,
+    observability_config: ObservabilityConfig | None = None,
+    should_observe_exceptions: bool = True,
+) -> AppBuilder:
+    """Create a builder of the fully set up application.
+
+    Args:
+        container: The container to resolve dependencies from.
+        observability_config: The observability config. Observability is not set up if it is None.
+        should_observe_exceptions: Whether exception handlers should report exceptions.
+
+    Returns:
+        AppBuilder: The builder to get the application or its server from.
+
+    """
+    app = FastAPI(
+        title="Python Backend Template",
+        description="Python Backend Template.",
+        version=__version__,
+        openapi_url=None,
+        default_response_class=PydanticJSONResponse,
+    )
+
+    app.include_router(router)
+
+    builder = AppBuilder(
+        container,
+        app,
+    )
+
+    await builder.setup_dishka()
+    await builder.setup_faststream(get_broker())
+    app.add_middleware(IdempotencyMiddleware, storage=await container.get(IdempotencyStorage))
+    await builder.setup_exception_handlers(should_observe_exceptions=should_observe_exceptions)
+    app.add_middleware(
+        StaticCORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    # Outside the idempotency middleware, so cached responses are stored uncompressed
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    if observability_config is not None:
+        await builder.setup_observability(observability_config=observability_config)
+    app.add_middleware(FastPathMiddleware, router=app.router)
+
+    # Build the middleware stack before serving, so Starlette rejects any middleware added afterwards
+    app.middleware_stack = app.build_middleware_stack()
+
+    return builder
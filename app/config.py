@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from haolib.configs.base import BaseConfig
-from haolib.configs.idempotency import IdempotencyConfig
 from haolib.configs.observability import ObservabilityConfig
 from haolib.configs.redis import RedisConfig
 from haolib.configs.server import ServerConfig
 from haolib.configs.sqlalchemy import SQLAlchemyConfig
-from pydantic import Field
+from pydantic import BaseModel, Field
+
+
+class IdempotencyConfig(BaseModel):
+    """Idempotency config."""
+
+    ttl: int = Field(default=24 * 60 * 60, description="Time to live of cached responses in seconds.")
+
+
+class DatabasePoolConfig(BaseModel):
+    """Database connection pool config."""
+
+    size: int = Field(default=20, description="Number of connections kept open in the pool.")
+    max_overflow: int = Field(default=10, description="Number of connections allowed above the pool size.")
+    recycle: int = Field(default=30 * 60, description="Time after which connections are reopened in seconds.")
+    timeout: float = Field(default=30.0, description="Time to wait for a free connection in seconds.")
+
+
+class HTTPClientConfig(BaseModel):
+    """HTTP client config."""
+
+    max_connections: int = Field(default=1000, description="Maximum number of concurrent connections.")
+    max_keepalive_connections: int = Field(default=100, description="Maximum number of idle keep-alive connections.")
+    timeout: float = Field(default=5.0, description="Timeout of requests in seconds.")
 
 
 # MUST ALWAYS BE LAST
@@ -17,6 +41,17 @@ class AppConfig(BaseConfig):
 
     observability: ObservabilityConfig = Field(default_factory=ObservabilityConfig)
     database: SQLAlchemyConfig
+    database_pool: DatabasePoolConfig = Field(default_factory=DatabasePoolConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
     server: ServerConfig = Field(default_factory=ServerConfig)
     idempotency: IdempotencyConfig = Field(default_factory=IdempotencyConfig)
+    http_client: HTTPClientConfig = Field(default_factory=HTTPClientConfig)
+
+
+@lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """Get the application config parsed from the environment once per process.
+
+    Use `get_app_config.cache_clear()` to parse the environment again.
+    """
+    return AppConfig.from_env()
@@ -1,6 +1,8 @@
 """Application dependencies."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
 import httpx
 from dishka import AsyncContainer, Scope, make_async_container
@@ -8,14 +10,15 @@ from dishka.integrations.aiogram import AiogramProvider
 from dishka.integrations.fastapi import FastapiProvider
 from dishka.integrations.faststream import FastStreamProvider
 from dishka.provider import provide
-from haolib.configs.idempotency import IdempotencyConfig
 from haolib.configs.redis import RedisConfig
 from haolib.configs.sqlalchemy import SQLAlchemyConfig
-from haolib.dependencies.idempotency import IdempotencyProvider
 from haolib.dependencies.redis import RedisProvider
 from haolib.dependencies.sqlalchemy import SQLAlchemyProvider
+from redis.asyncio import ConnectionPool, Redis
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
-from app.config import AppConfig
+from app.config import AppConfig, DatabasePoolConfig, HTTPClientConfig, IdempotencyConfig, get_app_config
+from app.middlewares.idempotency import IdempotencyStorage
 
 
 class AppProvider(FastapiProvider, AiogramProvider, FastStreamProvider):
@@ -29,7 +32,7 @@ class AppProvider(FastapiProvider, AiogramProvider, FastStreamProvider):
             AppConfig: The application configuration.
 
         """
-        return AppConfig.from_env()
+        return get_app_config()
 
     @provide(scope=Scope.APP)
     async def idempotency_config(self, app_config: AppConfig) -> IdempotencyConfig:
@@ -41,23 +44,138 @@ class AppProvider(FastapiProvider, AiogramProvider, FastStreamProvider):
         """Get sqlalchemy config."""
         return app_config.database
 
+    @provide(scope=Scope.APP)
+    async def database_pool_config(self, app_config: AppConfig) -> DatabasePoolConfig:
+        """Get database pool config."""
+        return app_config.database_pool
+
+    @provide(scope=Scope.APP)
+    async def db_engine(
+        self,
+        sqlalchemy_config: SQLAlchemyConfig,
+        database_pool_config: DatabasePoolConfig,
+    ) -> AsyncGenerator[AsyncEngine]:
+        """Get database engine.
+
+        Overrides the engine of `SQLAlchemyProvider` to configure its connection pool.
+        The most recently used connections are reused first, so rarely needed pooled connections stay idle
+        and are retired by server-side timeouts or `pool_recycle`.
+        The pool is filled before the engine is returned, so first requests do not open connections.
+
+        Returns:
+            AsyncGenerator[AsyncEngine]: A new AsyncGenerator instance.
+
+        """
+        engine = create_async_engine(
+            str(sqlalchemy_config.url),
+            pool_size=database_pool_config.size,
+            max_overflow=database_pool_config.max_overflow,
+            pool_recycle=database_pool_config.recycle,
+            pool_timeout=database_pool_config.timeout,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+        )
+        try:
+            await _warm_up_pool(engine, database_pool_config.size)
+            yield engine
+        finally:
+            await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    async def db_session_maker(self, db_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        """Get database session maker.
+
+        The session maker is bound to the engine once and shared by all requests.
+        """
+        return async_sessionmaker(db_engine, expire_on_commit=False)
+
+    @provide(scope=Scope.REQUEST)
+    async def db_session(
+        self,
+        db_session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncGenerator[AsyncSession, Exception | None]:
+        """Get database session.
+
+        Overrides the session of `SQLAlchemyProvider`. Dishka sends the exception the request failed with,
+        if any, into the generator. The session is committed only if there is none, so only unhandled
+        exceptions prevent the commit. Exceptions turned into responses by exception handlers, such as
+        `HTTPException`, are handled before the request scope closes, so writes made before them are committed.
+        Without a commit, closing the session rolls back its transaction, if any, and invalidates a broken
+        connection instead of sending a rollback over it.
+
+        Returns:
+            AsyncGenerator[AsyncSession, Exception | None]: A new AsyncGenerator instance.
+
+        """
+        async with db_session_maker() as session:
+            exc = yield session
+            if exc is None:
+                await session.commit()
+
     @provide(scope=Scope.APP)
     async def redis_config(self, app_config: AppConfig) -> RedisConfig:
         """Get redis config."""
         return app_config.redis
 
     @provide(scope=Scope.APP)
-    async def client(self) -> AsyncGenerator[httpx.AsyncClient]:
+    async def http_client_config(self, app_config: AppConfig) -> HTTPClientConfig:
+        """Get HTTP client config."""
+        return app_config.http_client
+
+    @provide(scope=Scope.APP)
+    async def idempotency_storage(
+        self,
+        redis_pool: ConnectionPool,
+        idempotency_config: IdempotencyConfig,
+    ) -> AsyncGenerator[IdempotencyStorage]:
+        """Get idempotency storage.
+
+        The storage is shared by all requests, so it has its own Redis client. The client uses the connection pool
+        of `RedisProvider`, so it is configured by `RedisConfig` the same way as the request-scoped clients.
+
+        Returns:
+            AsyncGenerator[IdempotencyStorage]: A new AsyncGenerator instance.
+
+        """
+        redis = Redis(connection_pool=redis_pool)
+        try:
+            yield IdempotencyStorage(redis, ttl=idempotency_config.ttl)
+        finally:
+            await redis.aclose()
+
+    @provide(scope=Scope.APP)
+    async def client(self, http_client_config: HTTPClientConfig) -> AsyncGenerator[httpx.AsyncClient]:
         """Get client.
 
+        The client is shared by all requests, so its connection pool is sized for concurrent outbound calls.
+
         Returns:
             AsyncGenerator[httpx.AsyncClient]: A new AsyncGenerator instance.
 
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=http_client_config.max_connections,
+                max_keepalive_connections=http_client_config.max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(http_client_config.timeout),
+        ) as client:
             yield client
 
 
+async def _warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    """Open `size` connections of the engine and return them to its pool.
+
+    The first connection is opened alone, so an unavailable database fails with its own error
+    instead of a group of the same errors. The rest are opened at once.
+    """
+    async with AsyncExitStack() as stack:
+        await stack.enter_async_context(engine.connect())
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(size - 1):
+                task_group.create_task(stack.enter_async_context(engine.connect()))
+
+
 def create_container() -> AsyncContainer:
     """Create a container."""
-    return make_async_container(SQLAlchemyProvider(), RedisProvider(), AppProvider(), IdempotencyProvider())
+    return make_async_container(SQLAlchemyProvider(), RedisProvider(), AppProvider())
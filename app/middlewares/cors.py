@@ -0,0 +1,36 @@
+"""CORS middleware."""
+
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Send
+
+
+class StaticCORSMiddleware(CORSMiddleware):
+    """CORS middleware which adds pre-encoded headers to simple responses.
+
+    Starlette's middleware encodes its static headers into every response. When
+    all origins are allowed and the request has no cookies, the headers do not
+    depend on the request, so they are encoded once here instead. Like in
+    Starlette's middleware, they replace the headers of the response with the same names.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs: Any) -> None:
+        super().__init__(app, **kwargs)
+        self.raw_simple_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in self.simple_headers.items()
+        ]
+        self.raw_simple_header_names = frozenset(name for name, _ in self.raw_simple_headers)
+
+    async def send(self, message: Message, send: Send, request_headers: Headers) -> None:
+        """Add CORS headers to the response start message and send it."""
+        if message["type"] != "http.response.start" or not self.allow_all_origins or "cookie" in request_headers:
+            await super().send(message, send, request_headers)
+            return
+
+        message["headers"] = [
+            *(header for header in message.get("headers", ()) if header[0] not in self.raw_simple_header_names),
+            *self.raw_simple_headers,
+        ]
+        await send(message)
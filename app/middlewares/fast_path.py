@@ -0,0 +1,29 @@
+"""Fast path middleware."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.routers.docs import DOCS_URL, OAUTH2_REDIRECT_URL, REDOC_URL
+
+FAST_PATHS = frozenset({"/health", DOCS_URL, OAUTH2_REDIRECT_URL, REDOC_URL})
+
+
+class FastPathMiddleware:
+    """Pure ASGI middleware which sends `GET` requests to `FAST_PATHS` directly to the router.
+
+    Health probes and documentation pages skip the rest of the middleware
+    stack, including the exception handlers, so it must be added last to be
+    the outermost one. Requests with other methods go down the whole stack,
+    so method mismatches are handled as usual. The OpenAPI schema is not a
+    fast path, so it can be compressed.
+    """
+
+    def __init__(self, app: ASGIApp, router: ASGIApp) -> None:
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] == "http" and scope["method"] == "GET" and scope["path"] in FAST_PATHS:
+            await self.router(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,182 @@
+"""Idempotency middleware."""
+
+from collections.abc import Iterable
+from hashlib import blake2b
+
+from redis.asyncio import Redis
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.schemas.idempotency import CachedResponse
+
+IDEMPOTENCY_KEY_HEADER = b"idempotency-key"
+IDEMPOTENT_METHODS = frozenset({"POST", "PATCH"})
+FIRST_CLIENT_ERROR_HTTP_CODE = 400
+KEY_DIGEST_SIZE = 16
+
+
+class IdempotencyStorage:
+    """Redis storage of responses to idempotent requests.
+
+    A response is stored as its JSON without the body, a newline and its raw body.
+    JSON never contains a raw newline, so the first one always ends the JSON.
+    """
+
+    _redis_key_prefix = "idempotency:"
+    _separator = b"\n"
+
+    def __init__(self, redis: Redis, ttl: int) -> None:
+        self._redis = redis
+        self._ttl = ttl
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response by its key."""
+        data = await self._redis.get(self._redis_key_prefix + key)
+        if data is None:
+            return None
+        response_json, _, body = data.partition(self._separator)
+        response = CachedResponse.model_validate_json(response_json)
+        response.body = body
+        return response
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        """Cache a response by its key unless a response is already cached by it.
+
+        `SET` with `NX` and `EX` stores the response and its TTL atomically in one round trip,
+        so concurrent duplicates of a request cannot overwrite the first cached response.
+        """
+        data = b"".join((response.model_dump_json().encode(), self._separator, response.body))
+        await self._redis.set(self._redis_key_prefix + key, data, ex=self._ttl, nx=True)
+
+
+class IdempotencyMiddleware:
+    """Pure ASGI middleware which replays responses to repeated idempotent requests.
+
+    A request is idempotent if its method is one of `IDEMPOTENT_METHODS` and
+    it has the `Idempotency-Key` header. Successful responses are cached by the
+    key, the method, the path and the body of the request.
+    """
+
+    def __init__(self, app: ASGIApp, storage: IdempotencyStorage) -> None:
+        self.app = app
+        self.storage = storage
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = _get_header(scope["headers"], IDEMPOTENCY_KEY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        hasher = _new_key_hasher(scope["method"].encode(), scope["path"].encode(), idempotency_key)
+        body = await _read_body(receive, hasher)
+        if body is None:
+            return
+
+        key = hasher.hexdigest()
+
+        cached_response = await self.storage.get(key)
+        if cached_response is not None:
+            await _send_cached_response(send, cached_response)
+            return
+
+        status_code = 0
+        headers: list[tuple[bytes, bytes]] = []
+        response_chunks: list[bytes] = []
+
+        async def intercept_send(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Copied, because outer middlewares may change the list in place after the message is sent
+                headers = list(message.get("headers", ()))
+            elif message["type"] == "http.response.body":
+                response_chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, _replay_body(body, receive), intercept_send)
+
+        if 0 < status_code < FIRST_CLIENT_ERROR_HTTP_CODE:
+            await self.storage.put(
+                key,
+                CachedResponse(status_code=status_code, headers=headers, body=b"".join(response_chunks)),
+            )
+
+
+def _get_header(headers: Iterable[tuple[bytes, bytes]], name: bytes) -> bytes | None:
+    """Get the value of a header from raw ASGI headers."""
+    for header_name, value in headers:
+        if header_name == name:
+            return value
+    return None
+
+
+def _new_key_hasher(*fields: bytes) -> blake2b:
+    """Create a hasher of a cache key fed with the fields.
+
+    Each field is prefixed with its length, so different fields never hash the same bytes.
+    The body is hashed after them, so it needs no prefix.
+    """
+    hasher = blake2b(digest_size=KEY_DIGEST_SIZE)
+    for field in fields:
+        hasher.update(len(field).to_bytes(8, "big"))
+        hasher.update(field)
+    return hasher
+
+
+async def _read_body(receive: Receive, hasher: blake2b) -> bytes | None:
+    """Read the whole body of a request and feed it to the hasher chunk by chunk.
+
+    Returns:
+        bytes | None: The body or None if the client has disconnected.
+
+    """
+    message = await receive()
+    if message["type"] == "http.disconnect":
+        return None
+    chunk = message.get("body", b"")
+    hasher.update(chunk)
+    # Most bodies arrive in a single message, which needs no buffering
+    if not message.get("more_body", False):
+        return chunk
+
+    chunks = [chunk]
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunk = message.get("body", b"")
+        hasher.update(chunk)
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Create a receive callable which returns the already read body first."""
+    is_body_sent = False
+
+    async def replay() -> Message:
+        nonlocal is_body_sent
+        if is_body_sent:
+            return await receive()
+        is_body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+async def _send_cached_response(send: Send, cached_response: CachedResponse) -> None:
+    """Send a cached response."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": cached_response.status_code,
+            "headers": cached_response.headers,
+        },
+    )
+    await send({"type": "http.response.body", "body": cached_response.body})
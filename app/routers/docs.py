@@ -0,0 +1,60 @@
+"""OpenAPI documentation router.
+
+FastAPI's built-in `/openapi.json` route re-encodes the whole schema on every hit,
+so the application is created with `openapi_url=None` and the documentation is
+served by this router from the schema cached by `get_openapi_body`.
+"""
+
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.responses import HTMLResponse
+from pydantic_core import to_json
+
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+REDOC_URL = "/redoc"
+
+docs_router = APIRouter(include_in_schema=False)
+
+
+def get_openapi_body(app: FastAPI) -> bytes:
+    """Get the encoded OpenAPI schema of the app.
+
+    The schema is generated and encoded on the first call and cached, so workers
+    which never serve the documentation never generate it.
+    """
+    openapi_body: bytes | None = getattr(app.state, "openapi_body", None)
+    if openapi_body is None:
+        openapi_body = app.state.openapi_body = to_json(app.openapi())
+    return openapi_body
+
+
+@docs_router.get(OPENAPI_URL)
+async def openapi(request: Request) -> Response:
+    """OpenAPI schema endpoint."""
+    return Response(get_openapi_body(request.app), media_type="application/json")
+
+
+@docs_router.get(DOCS_URL)
+async def swagger_ui_html(request: Request) -> HTMLResponse:
+    """Swagger UI endpoint."""
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    return get_swagger_ui_html(
+        openapi_url=root_path + OPENAPI_URL,
+        title=f"{request.app.title} - Swagger UI",
+        oauth2_redirect_url=root_path + OAUTH2_REDIRECT_URL,
+    )
+
+
+@docs_router.get(OAUTH2_REDIRECT_URL)
+async def swagger_ui_redirect() -> HTMLResponse:
+    """Swagger UI OAuth2 redirect endpoint."""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@docs_router.get(REDOC_URL)
+async def redoc_html(request: Request) -> HTMLResponse:
+    """ReDoc endpoint."""
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    return get_redoc_html(openapi_url=root_path + OPENAPI_URL, title=f"{request.app.title} - ReDoc")
@@ -0,0 +1,17 @@
+"""Application response classes."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core instead of the stdlib `json` module.
+
+    NaN and infinities are not valid JSON, so they are rendered as null.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render the content."""
+        return to_json(content, inf_nan_mode="null")
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter
 
+from app.routers.docs import docs_router
 from app.routers.health import health_router
 from app.routers.queues.router import mq_router
 
@@ -9,3 +10,4 @@ router = APIRouter()
 
 router.include_router(mq_router)
 router.include_router(health_router)
+router.include_router(docs_router)
@@ -0,0 +1,17 @@
+"""Idempotency schemas."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CachedResponse(BaseModel):
+    """Response cached for an idempotent request.
+
+    The body is excluded from the JSON, so it can be stored raw next to it.
+    The headers are kept as raw ASGI headers, so they are sent without re-encoding.
+    """
+
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes = Field(default=b"", exclude=True)
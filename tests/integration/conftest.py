@@ -7,10 +7,9 @@ from typing import Any
 
 import pytest
 import pytest_asyncio
-from dishka import AsyncContainer, Scope, make_async_container
+from dishka import AsyncContainer, Scope, make_async_container, provide
 from fastapi import FastAPI
 from faststream.confluent import KafkaBroker, TestKafkaBroker
-from haolib.app import AppBuilder
 from haolib.dependencies.redis import RedisProvider
 from haolib.dependencies.sqlalchemy import SQLAlchemyProvider
 from haolib.models.base import AbstractModel
@@ -18,20 +17,36 @@ from httpx import ASGITransport, AsyncClient
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.app import create_app_builder
+from app.config import DatabasePoolConfig
 from app.dependencies import AppProvider
 from app.routers.queues.router import get_broker
-from app.routers.router import router
-from app.version import __version__
+
+TEST_DATABASE_POOL_SIZE = 2
+TEST_DATABASE_POOL_MAX_OVERFLOW = 2
 
 
 class MockAppProvider(AppProvider):
     """Mock container."""
 
+    @provide(scope=Scope.APP)
+    async def database_pool_config(self) -> DatabasePoolConfig:
+        """Get database pool config.
+
+        The pool is small, so parallel test workers do not exhaust the connections of the database.
+        """
+        return DatabasePoolConfig(size=TEST_DATABASE_POOL_SIZE, max_overflow=TEST_DATABASE_POOL_MAX_OVERFLOW)
+
 
 @pytest_asyncio.fixture
-async def container() -> AsyncContainer:
-    """Get container."""
-    return make_async_container(SQLAlchemyProvider(), RedisProvider(), MockAppProvider())
+async def container() -> AsyncGenerator[AsyncContainer]:
+    """Get container.
+
+    The container is closed after the test, so the connections of its pools are closed too.
+    """
+    container = make_async_container(SQLAlchemyProvider(), RedisProvider(), MockAppProvider())
+    yield container
+    await container.close()
 
 
 @pytest.fixture
@@ -60,23 +75,7 @@ async def clean_redis(container: AsyncContainer) -> None:
 @pytest_asyncio.fixture()
 async def app(container: AsyncContainer) -> AsyncGenerator[FastAPI]:
     """Create FastAPI app for testing without bot polling."""
-    app = FastAPI(
-        title="Python Backend Template",
-        description="Python Backend Template.",
-        version=__version__,
-    )
-
-    app.include_router(router)
-
-    builder = AppBuilder(
-        container,
-        app,
-    )
-
-    await builder.setup_faststream(get_broker())
-    await builder.setup_idempotency_middleware()
-    await builder.setup_exception_handlers(should_observe_exceptions=False)
-    await builder.setup_cors_middleware()
+    builder = await create_app_builder(container, should_observe_exceptions=False)
     app = await builder.get_app()
 
     yield app
@@ -0,0 +1,60 @@
+"""Tests for the response compression."""
+
+from http import HTTPStatus
+
+import pytest
+from dishka import AsyncContainer, Scope
+from fastapi import FastAPI, Response
+from httpx import AsyncClient
+from redis.asyncio import Redis
+
+LARGE_URL = "/large"
+LARGE_BODY = b"a" * 2048
+
+
+@pytest.fixture
+def handled_count(app: FastAPI) -> list[int]:
+    """Add a route with a response large enough to be compressed and get the numbers of the requests it handles."""
+    handled: list[int] = []
+
+    async def handle_large() -> Response:
+        handled.append(len(handled) + 1)
+        return Response(LARGE_BODY)
+
+    app.add_api_route(LARGE_URL, handle_large, methods=["GET", "POST"])
+
+    return handled
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("handled_count")
+async def test_large_response_is_compressed(test_client: AsyncClient) -> None:
+    """Test that a large response is gzip-encoded for a client which accepts gzip."""
+    response = await test_client.get(LARGE_URL, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == LARGE_BODY
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+async def test_replayed_response_is_compressed_for_replaying_client(
+    container: AsyncContainer,
+    test_client: AsyncClient,
+    handled_count: list[int],
+) -> None:
+    """Test that an idempotent response is cached uncompressed and compressed for each client on its own."""
+    headers = {"Idempotency-Key": "key"}
+    first = await test_client.post(LARGE_URL, headers={**headers, "Accept-Encoding": "gzip"})
+    second = await test_client.post(LARGE_URL, headers={**headers, "Accept-Encoding": "identity"})
+
+    async with container(scope=Scope.REQUEST) as nested_container:
+        redis = await nested_container.get(Redis)
+        cached_values = [await redis.get(key) for key in await redis.keys("idempotency:*")]
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in second.headers
+    assert first.content == second.content == LARGE_BODY
+    assert [value.endswith(LARGE_BODY) for value in cached_values] == [True]
+    assert handled_count == [1]
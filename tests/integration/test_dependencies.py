@@ -0,0 +1,135 @@
+"""Tests for the application dependencies."""
+
+from collections.abc import AsyncGenerator
+from http import HTTPStatus
+
+import pytest
+import pytest_asyncio
+from dishka import AsyncContainer, Scope
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import FastAPI, HTTPException
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import QueuePool
+
+from app.config import DatabasePoolConfig
+
+HTTP_EXCEPTION_URL = "/session-test/http-exception"
+UNHANDLED_EXCEPTION_URL = "/session-test/unhandled-exception"
+
+
+@pytest_asyncio.fixture()
+async def session_test_table(container: AsyncContainer) -> AsyncGenerator[None]:
+    """Create an empty table to write to in the session tests and drop it afterwards."""
+    engine = await container.get(AsyncEngine)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS session_test"))
+        await conn.execute(text("CREATE TABLE session_test (id integer)"))
+    yield
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE session_test"))
+
+
+@pytest.fixture
+def session_test_routes(app: FastAPI) -> None:
+    """Add routes which write to the session test table and raise to the app."""
+
+    @inject
+    async def raise_http_exception(session: FromDishka[AsyncSession]) -> None:
+        await session.execute(text("INSERT INTO session_test VALUES (1)"))
+        raise HTTPException(HTTPStatus.CONFLICT)
+
+    @inject
+    async def raise_unhandled_exception(session: FromDishka[AsyncSession]) -> None:
+        await session.execute(text("INSERT INTO session_test VALUES (1)"))
+        raise RuntimeError
+
+    app.add_api_route(HTTP_EXCEPTION_URL, raise_http_exception, methods=["POST"])
+    app.add_api_route(UNHANDLED_EXCEPTION_URL, raise_unhandled_exception, methods=["POST"])
+
+
+async def _count_session_test_rows(container: AsyncContainer) -> int:
+    """Count the rows committed to the session test table."""
+    async with (await container.get(AsyncEngine)).connect() as conn:
+        return (await conn.execute(text("SELECT count(*) FROM session_test"))).scalar_one()
+
+
+async def _insert_and_raise(container: AsyncContainer) -> None:
+    """Write to the session test table in a request scope and fail the request."""
+    async with container(scope=Scope.REQUEST) as request_container:
+        session = await request_container.get(AsyncSession)
+        await session.execute(text("INSERT INTO session_test VALUES (1)"))
+        raise RuntimeError
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("session_test_table")
+async def test_db_session_commits_successful_request(container: AsyncContainer) -> None:
+    """Test that writes of a successful request are committed."""
+    async with container(scope=Scope.REQUEST) as request_container:
+        session = await request_container.get(AsyncSession)
+        await session.execute(text("INSERT INTO session_test VALUES (1)"))
+
+    assert await _count_session_test_rows(container) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("session_test_table")
+async def test_db_session_does_not_commit_failed_request(container: AsyncContainer) -> None:
+    """Test that writes of a request which raised are not committed."""
+    with pytest.raises(RuntimeError):
+        await _insert_and_raise(container)
+
+    assert await _count_session_test_rows(container) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("session_test_table", "session_test_routes")
+async def test_db_session_commits_request_with_handled_exception(
+    container: AsyncContainer,
+    test_client: AsyncClient,
+) -> None:
+    """Test that writes of a request whose exception became an error response are committed."""
+    response = await test_client.post(HTTP_EXCEPTION_URL)
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert await _count_session_test_rows(container) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("session_test_table", "session_test_routes")
+async def test_db_session_does_not_commit_request_with_unhandled_exception(
+    container: AsyncContainer,
+    test_client: AsyncClient,
+) -> None:
+    """Test that writes of a request whose exception reached the server are not committed."""
+    with pytest.raises(RuntimeError):
+        await test_client.post(UNHANDLED_EXCEPTION_URL)
+
+    assert await _count_session_test_rows(container) == 0
+
+
+@pytest.mark.asyncio
+async def test_db_engine_fills_pool(container: AsyncContainer) -> None:
+    """Test that the pool holds the configured number of open connections once the engine is resolved."""
+    engine = await container.get(AsyncEngine)
+    database_pool_config = await container.get(DatabasePoolConfig)
+
+    assert engine.pool.checkedin() == database_pool_config.size
+
+
+@pytest.mark.asyncio
+async def test_db_engine_pool_is_configured(container: AsyncContainer) -> None:
+    """Test that the pool of the engine has the configured size, overflow, timeout and order."""
+    engine = await container.get(AsyncEngine)
+    database_pool_config = await container.get(DatabasePoolConfig)
+
+    pool = engine.pool
+
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == database_pool_config.size
+    assert pool.timeout() == database_pool_config.timeout
+    # The pool exposes no public accessors for the maximum overflow and the order of its connections
+    assert pool._max_overflow == database_pool_config.max_overflow  # noqa: SLF001
+    assert pool._pool.use_lifo  # noqa: SLF001
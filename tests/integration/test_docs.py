@@ -0,0 +1,44 @@
+"""Tests for the documentation router."""
+
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pydantic_core import to_json
+
+from app.routers.docs import DOCS_URL, OPENAPI_URL, REDOC_URL
+
+
+@pytest.mark.asyncio
+async def test_openapi_returns_schema(app: FastAPI, test_client: AsyncClient) -> None:
+    """Test that the OpenAPI endpoint returns the encoded schema of the app."""
+    response = await test_client.get(OPENAPI_URL)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == to_json(app.openapi())
+
+
+@pytest.mark.asyncio
+async def test_openapi_body_is_cached_on_first_request(app: FastAPI, test_client: AsyncClient) -> None:
+    """Test that the schema is encoded on the first request to the OpenAPI endpoint and reused afterwards."""
+    assert getattr(app.state, "openapi_body", None) is None
+
+    first = await test_client.get(OPENAPI_URL)
+    openapi_body = app.state.openapi_body
+    second = await test_client.get(OPENAPI_URL)
+
+    assert first.content == second.content == openapi_body
+    assert app.state.openapi_body is openapi_body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", [DOCS_URL, REDOC_URL])
+async def test_docs_page_points_at_openapi(test_client: AsyncClient, url: str) -> None:
+    """Test that the documentation pages are served and load the schema from the OpenAPI endpoint."""
+    response = await test_client.get(url)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/html")
+    assert f"'{OPENAPI_URL}'" in response.text or f'"{OPENAPI_URL}"' in response.text
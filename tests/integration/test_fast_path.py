@@ -0,0 +1,29 @@
+"""Tests for the fast path middleware."""
+
+from http import HTTPStatus
+
+import pytest
+from httpx import AsyncClient
+
+from app.routers.docs import OPENAPI_URL
+
+HEALTH_URL = "/health"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", [HEALTH_URL, OPENAPI_URL])
+async def test_get_request_is_handled(test_client: AsyncClient, url: str) -> None:
+    """Test that GET requests to the fast paths and the OpenAPI schema are handled."""
+    response = await test_client.get(url)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", [HEALTH_URL, OPENAPI_URL])
+@pytest.mark.parametrize("method", ["HEAD", "POST"])
+async def test_method_mismatch_is_not_server_error(test_client: AsyncClient, url: str, method: str) -> None:
+    """Test that other methods are rejected by the exception handlers instead of failing the app."""
+    response = await test_client.request(method, url)
+
+    assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
@@ -0,0 +1,27 @@
+"""Tests for the health check router."""
+
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+HEALTH_URL = "/health"
+
+
+@pytest.mark.asyncio
+async def test_health_check(test_client: AsyncClient) -> None:
+    """Test that the health check responds with the healthy status in JSON."""
+    response = await test_client.get(HEALTH_URL)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_health_check_schema(app: FastAPI) -> None:
+    """Test that the OpenAPI schema documents the healthy status of the health check."""
+    response_schema = app.openapi()["paths"][HEALTH_URL]["get"]["responses"]["200"]
+
+    assert response_schema["content"]["application/json"]["example"] == {"status": "healthy"}
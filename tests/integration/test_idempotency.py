@@ -0,0 +1,149 @@
+"""Tests for the idempotency middleware."""
+
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from httpx import AsyncClient
+
+ITEMS_URL = "/items"
+ITEMS_X_URL = "/itemsx"
+
+
+@pytest.fixture
+def handled_bodies(app: FastAPI) -> list[bytes]:
+    """Add item routes to the app and get the bodies of the requests they handle.
+
+    The routes respond with the number of handled requests and the status code from the `status` query parameter.
+    """
+    bodies: list[bytes] = []
+
+    async def handle_item(request: Request) -> Response:
+        bodies.append(await request.body())
+        return Response(str(len(bodies)).encode(), status_code=int(request.query_params.get("status", "200")))
+
+    for path in (ITEMS_URL, ITEMS_X_URL):
+        app.add_api_route(path, handle_item, methods=["GET", "POST", "PATCH"])
+
+    return bodies
+
+
+def _key(key: str) -> dict[str, str]:
+    """Get the headers of a request with the idempotency key."""
+    return {"Idempotency-Key": key}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+@pytest.mark.parametrize("method", ["POST", "PATCH"])
+async def test_repeated_request_is_replayed(test_client: AsyncClient, handled_bodies: list[bytes], method: str) -> None:
+    """Test that a repeated request gets the cached response without being handled again."""
+    first = await test_client.request(method, ITEMS_URL, content=b"body", headers=_key("key"))
+    second = await test_client.request(method, ITEMS_URL, content=b"body", headers=_key("key"))
+
+    assert first.status_code == second.status_code == HTTPStatus.OK
+    assert first.content == second.content == b"1"
+    assert first.headers["content-length"] == second.headers["content-length"]
+    assert handled_bodies == [b"body"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+async def test_different_body_is_not_replayed(test_client: AsyncClient, handled_bodies: list[bytes]) -> None:
+    """Test that a request with the same key and a different body is handled."""
+    await test_client.post(ITEMS_URL, content=b"first", headers=_key("key"))
+    response = await test_client.post(ITEMS_URL, content=b"second", headers=_key("key"))
+
+    assert response.content == b"2"
+    assert handled_bodies == [b"first", b"second"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+async def test_different_key_is_not_replayed(test_client: AsyncClient, handled_bodies: list[bytes]) -> None:
+    """Test that a request with the same body and a different key is handled."""
+    await test_client.post(ITEMS_URL, content=b"body", headers=_key("first"))
+    response = await test_client.post(ITEMS_URL, content=b"body", headers=_key("second"))
+
+    assert response.content == b"2"
+    assert handled_bodies == [b"body", b"body"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+@pytest.mark.parametrize("status_code", [400, 404, 500])
+async def test_error_response_is_not_cached(
+    test_client: AsyncClient,
+    handled_bodies: list[bytes],
+    status_code: int,
+) -> None:
+    """Test that client and server error responses are not replayed."""
+    url = f"{ITEMS_URL}?status={status_code}"
+    await test_client.post(url, content=b"body", headers=_key("key"))
+    response = await test_client.post(url, content=b"body", headers=_key("key"))
+
+    assert response.status_code == status_code
+    assert response.content == b"2"
+    assert handled_bodies == [b"body", b"body"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+async def test_get_request_passes_through(test_client: AsyncClient, handled_bodies: list[bytes]) -> None:
+    """Test that requests with methods which are not idempotent are always handled."""
+    await test_client.get(ITEMS_URL, headers=_key("key"))
+    response = await test_client.get(ITEMS_URL, headers=_key("key"))
+
+    assert response.content == b"2"
+    assert handled_bodies == [b"", b""]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+async def test_request_without_key_passes_through(test_client: AsyncClient, handled_bodies: list[bytes]) -> None:
+    """Test that requests without the idempotency key are always handled."""
+    await test_client.post(ITEMS_URL, content=b"body")
+    response = await test_client.post(ITEMS_URL, content=b"body")
+
+    assert response.content == b"2"
+    assert handled_bodies == [b"body", b"body"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+async def test_multi_chunk_body_is_read_whole(test_client: AsyncClient, handled_bodies: list[bytes]) -> None:
+    """Test that a body sent in several messages reaches the handler and the cache key whole."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in (b"first ", b"second ", b"third"):
+            yield chunk
+
+    await test_client.post(ITEMS_URL, content=chunks(), headers=_key("key"))
+    response = await test_client.post(ITEMS_URL, content=b"first second third", headers=_key("key"))
+
+    assert response.content == b"1"
+    assert handled_bodies == [b"first second third"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("clean_redis")
+@pytest.mark.parametrize(
+    ("first_request", "second_request"),
+    [
+        ((ITEMS_URL, b"ab", "c"), (ITEMS_URL, b"a", "bc")),
+        ((ITEMS_X_URL, b"", "k"), (ITEMS_URL, b"x", "k")),
+    ],
+)
+async def test_requests_with_same_concatenated_fields_are_not_replayed(
+    test_client: AsyncClient,
+    handled_bodies: list[bytes],
+    first_request: tuple[str, bytes, str],
+    second_request: tuple[str, bytes, str],
+) -> None:
+    """Test that the path, the body and the key do not run into each other in the cache key."""
+    for url, body, key in (first_request, second_request):
+        response = await test_client.post(url, content=body, headers=_key(key))
+
+    assert response.content == b"2"
+    assert handled_bodies == [first_request[1], second_request[1]]
@@ -3,18 +3,29 @@
 from collections.abc import AsyncGenerator
 
 import pytest_asyncio
-from dishka import AsyncContainer, Scope, make_async_container
+from dishka import AsyncContainer, Scope, make_async_container, provide
+from haolib.dependencies.redis import RedisProvider
 
+from app.config import HTTPClientConfig
 from app.dependencies import AppProvider
 
 
 class MockAppProvider(AppProvider):
     """Mock container."""
 
+    @provide(scope=Scope.APP)
+    async def http_client_config(self) -> HTTPClientConfig:
+        """Get HTTP client config."""
+        return HTTPClientConfig(max_connections=10, max_keepalive_connections=5, timeout=1.0)
+
 
 @pytest_asyncio.fixture
 async def container() -> AsyncGenerator[AsyncContainer]:
-    """Get container."""
-    container = make_async_container(MockAppProvider())
+    """Get container.
+
+    The container is closed after the test, so the clients it has created are closed too.
+    """
+    container = make_async_container(RedisProvider(), MockAppProvider())
     async with container(scope=Scope.REQUEST) as nested_container:
         yield nested_container
+    await container.close()
@@ -0,0 +1,34 @@
+"""Tests for the application config."""
+
+from collections.abc import Generator
+
+import pytest
+
+from app.config import AppConfig, get_app_config
+
+
+@pytest.fixture
+def parsed_configs(monkeypatch: pytest.MonkeyPatch) -> Generator[list[object]]:
+    """Replace parsing of the config from the environment and get the parsed configs."""
+    configs: list[object] = []
+
+    def from_env() -> object:
+        configs.append(object())
+        return configs[-1]
+
+    monkeypatch.setattr(AppConfig, "from_env", from_env)
+    get_app_config.cache_clear()
+    yield configs
+    get_app_config.cache_clear()
+
+
+def test_get_app_config_is_cached(parsed_configs: list[object]) -> None:
+    """Test that the config is parsed once and parsed again only after the cache is cleared."""
+    first = get_app_config()
+    second = get_app_config()
+    get_app_config.cache_clear()
+    third = get_app_config()
+
+    assert first is second
+    assert third is not first
+    assert parsed_configs == [first, third]
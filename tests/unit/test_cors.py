@@ -0,0 +1,82 @@
+"""Tests for the CORS middleware."""
+
+from typing import Any
+
+import pytest
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middlewares.cors import StaticCORSMiddleware
+
+CORS_OPTIONS = {
+    "allow_origins": ["*"],
+    "allow_credentials": True,
+    "allow_methods": ["*"],
+    "allow_headers": ["*"],
+    "expose_headers": ["X-Total-Count"],
+}
+
+
+def _create_app(headers: list[tuple[bytes, bytes]]) -> ASGIApp:
+    """Create an ASGI app which responds with the headers."""
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": list(headers)})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def _get_response_headers(
+    middleware_class: type[CORSMiddleware],
+    response_headers: list[tuple[bytes, bytes]],
+    request_headers: list[tuple[bytes, bytes]],
+    **options: Any,
+) -> list[tuple[bytes, bytes]]:
+    """Get the sorted headers of the response sent through the middleware."""
+    middleware = middleware_class(_create_app(response_headers), **options)
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware({"type": "http", "method": "GET", "path": "/", "headers": request_headers}, receive, send)
+    return sorted(messages[0]["headers"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response_headers",
+    [
+        [],
+        [(b"content-type", b"application/json")],
+        [
+            (b"content-type", b"application/json"),
+            (b"access-control-allow-origin", b"https://example.com"),
+            (b"access-control-allow-credentials", b"false"),
+            (b"access-control-allow-credentials", b"false"),
+        ],
+    ],
+)
+@pytest.mark.parametrize(
+    "request_headers",
+    [
+        [(b"origin", b"https://example.com")],
+        [(b"origin", b"https://example.com"), (b"cookie", b"session=1")],
+    ],
+)
+@pytest.mark.parametrize("options", [CORS_OPTIONS, {**CORS_OPTIONS, "allow_origins": ["https://example.com"]}])
+async def test_static_cors_middleware_sends_same_headers_as_cors_middleware(
+    response_headers: list[tuple[bytes, bytes]],
+    request_headers: list[tuple[bytes, bytes]],
+    options: dict[str, Any],
+) -> None:
+    """Test that the pre-encoded headers replace the response headers like in Starlette's middleware."""
+    expected_headers = await _get_response_headers(CORSMiddleware, response_headers, request_headers, **options)
+
+    headers = await _get_response_headers(StaticCORSMiddleware, response_headers, request_headers, **options)
+
+    assert headers == expected_headers
@@ -0,0 +1,33 @@
+"""Tests for the application dependencies."""
+
+from typing import Any
+
+import httpx
+import pytest
+from dishka import AsyncContainer
+from httpx import AsyncClient, Limits, Timeout
+
+from app.config import HTTPClientConfig
+
+
+@pytest.mark.asyncio
+async def test_client_uses_config(container: AsyncContainer, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the HTTP client is created with the limits and the timeout from the config."""
+    client_kwargs: dict[str, Any] = {}
+
+    class RecordingAsyncClient(AsyncClient):
+        def __init__(self, **kwargs: Any) -> None:
+            client_kwargs.update(kwargs)
+            super().__init__(**kwargs)
+
+    # The provider looks the class up in the module when called, the container resolves it by the original class
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingAsyncClient)
+    client = await container.get(AsyncClient)
+    http_client_config = await container.get(HTTPClientConfig)
+
+    assert isinstance(client, RecordingAsyncClient)
+    assert client_kwargs["limits"] == Limits(
+        max_connections=http_client_config.max_connections,
+        max_keepalive_connections=http_client_config.max_keepalive_connections,
+    )
+    assert client_kwargs["timeout"] == Timeout(http_client_config.timeout)
@@ -0,0 +1,22 @@
+"""Tests for the application response classes."""
+
+import json
+
+import pytest
+
+from app.routers.responses import PydanticJSONResponse
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_pydantic_json_response_renders_non_finite_floats_as_null(value: float) -> None:
+    """Test that the rendered body is valid JSON for NaN and infinities."""
+    response = PydanticJSONResponse({"value": value})
+
+    assert response.body == b'{"value":null}'
+
+
+def test_pydantic_json_response_renders_like_json_response() -> None:
+    """Test that the rendered body decodes to the content."""
+    content = {"string": "строка", "number": 1.5, "list": [1, None, True]}
+
+    assert json.loads(PydanticJSONResponse(content).body) == content